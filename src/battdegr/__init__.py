@@ -16,6 +16,7 @@ from .models import (
 
 from .analysis import (
     LifetimePredictor,
+    ScenarioResult,
     StressFactorAnalysis,
     ModelValidator
 )
@@ -25,6 +26,7 @@ __all__ = [
     "SemiEmpiricalModel",
     "EmpiricalModel",
     "LifetimePredictor",
+    "ScenarioResult",
     "StressFactorAnalysis",
     "ModelValidator",
 ]
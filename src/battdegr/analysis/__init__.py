@@ -2,12 +2,13 @@
 Analysis package for battery degradation assessment
 """
 
-from .lifetime_predictor import LifetimePredictor
+from .lifetime_predictor import LifetimePredictor, ScenarioResult
 from .stress_analysis import StressFactorAnalysis
 from .model_validator import ModelValidator
 
 __all__ = [
     "LifetimePredictor",
+    "ScenarioResult",
     "StressFactorAnalysis",
     "ModelValidator",
 ]
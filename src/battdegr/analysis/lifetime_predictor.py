@@ -2,9 +2,25 @@
 Lifetime prediction and end-of-life assessment tools
 """
 
+import sys
+from dataclasses import dataclass
+
 import numpy as np
-from typing import Tuple, Optional
-import matplotlib.pyplot as plt
+from typing import Callable, Tuple, Optional
+
+from ..utils.kernels import first_crossing
+
+
+@dataclass
+class ScenarioResult:
+    """
+    Lifetime of a single operating scenario from `compare_scenarios`.
+    """
+    __slots__ = ('eol_years', 'eol_cycles', 'temperature')
+    
+    eol_years: float
+    eol_cycles: float
+    temperature: float
 
 
 class LifetimePredictor:
@@ -12,6 +28,9 @@ class LifetimePredictor:
     Tools for predicting battery lifetime and end-of-life.
     """
     
+    # Working precision of the day-resolution EOL scan
+    _dtype = np.float32
+    
     def __init__(self, model):
         """
         Initialize with a degradation model.
@@ -27,7 +46,8 @@ class LifetimePredictor:
                          cycles_per_day: float = 1.0,
                          eol_threshold: float = 0.8,
                          max_years: int = 30,
-                         **kwargs) -> Tuple[float, float]:
+                         return_curve: bool = False,
+                         **kwargs) -> tuple:
         """
         Estimate battery lifetime to reach EOL.
         
@@ -40,7 +60,12 @@ class LifetimePredictor:
         eol_threshold : float
             End-of-life capacity retention [0-1]
         max_years : int
-            Maximum years to simulate
+            Maximum years to simulate. The EOL crossing is root-found only
+            for models with ``monotonic = True``; otherwise, or if the
+            crossing is not bracketed by this horizon, a day-resolution
+            scan in float32 is used.
+        return_curve : bool
+            Also return the retention curve over ``max_years``
         **kwargs : dict
             Additional parameters (soc_avg, dod, c_rate, etc.)
             
@@ -50,39 +75,136 @@ class LifetimePredictor:
             Time to EOL [days]
         eol_cycles : float
             Cycles to EOL
+        curve : tuple of (time_days, retention, eol_time)
+            Only if ``return_curve`` is True; can be passed to
+            `plot_lifetime_prediction` as ``precomputed``
+        """
+        eol_time, eol_cycles = self._estimate_lifetime(
+            temperature, cycles_per_day, eol_threshold, max_years, None,
+            **kwargs
+        )
+        
+        if not return_curve:
+            return eol_time, eol_cycles
+        
+        time_days, retention = self._retention_curve(
+            temperature, cycles_per_day, max_years, **kwargs
+        )
+        return eol_time, eol_cycles, (time_days, retention, eol_time)
+    
+    def _estimate_lifetime(self, temperature: float, cycles_per_day: float,
+                           eol_threshold: float, max_years: int,
+                           get_grid: Optional[Callable[[], tuple]],
+                           **kwargs) -> Tuple[float, float]:
+        """
+        Estimate lifetime; ``get_grid`` supplies a shared ``(time_days,
+        cycles)`` grid from `_time_grid` for the dense scan.
         """
-        # Create time and cycle arrays
-        time_days = np.linspace(0, max_years * 365, max_years * 365)
+        # brentq finds *a* root in the bracket, which is only the first
+        # crossing when fade is non-decreasing
+        if getattr(self.model, 'monotonic', False):
+            from scipy.optimize import brentq
+            
+            threshold_fade = (1.0 - eol_threshold) * 100.0
+            t_max = max_years * 365.0
+            
+            def excess_fade(t):
+                return self._fade_scalar(t, temperature, cycles_per_day,
+                                         **kwargs) - threshold_fade
+            
+            # Root-find the EOL crossing; fall back to the dense scan when
+            # the crossing is not bracketed by [1 day, max_years]
+            if excess_fade(1.0) < 0 <= excess_fade(t_max):
+                eol_time = brentq(excess_fade, 1.0, t_max, xtol=0.5)
+                return eol_time, eol_time * cycles_per_day
+        
+        if get_grid is None:
+            grid = self._time_grid(cycles_per_day, max_years)
+        else:
+            grid = get_grid()
+        
+        return self._estimate_lifetime_core(*grid, temperature,
+                                            eol_threshold, **kwargs)
+    
+    def _fade_scalar(self, t: float, temperature: float,
+                     cycles_per_day: float, **kwargs) -> float:
+        """Evaluate the model fade [%] at a single time point [days]."""
+        fade = self.model.predict_fade(np.array([t]),
+                                       np.array([t * cycles_per_day]),
+                                       temperature, **kwargs)
+        return float(fade[0])
+    
+    def _time_grid(self, cycles_per_day: float,
+                   max_years: int) -> Tuple[np.ndarray, ...]:
+        """Build the day-resolution time and cycle grid."""
+        time_days = np.arange(max_years * 365, dtype=self._dtype)
         cycles = time_days * cycles_per_day
         
+        return time_days, cycles
+    
+    def _estimate_lifetime_core(self, time_days: np.ndarray,
+                                cycles: np.ndarray,
+                                temperature: float, eol_threshold: float,
+                                **kwargs) -> Tuple[float, float]:
+        """Locate EOL by sampling the fade curve on a precomputed grid."""
         # Predict fade
         fade = self.model.predict_fade(time_days, cycles, temperature, **kwargs)
-        retention = 1.0 - (fade / 100.0)
+        fade = np.asarray(fade).astype(self._dtype, copy=False)
         
-        # Find EOL point
-        idx = np.where(retention <= eol_threshold)[0]
-        if len(idx) > 0:
-            eol_time = time_days[idx[0]]
-            eol_cycles = cycles[idx[0]]
+        # Find EOL point directly on the fade curve; a sorted search is only
+        # valid for models that advertise non-decreasing fade
+        threshold_fade = self._dtype((1.0 - eol_threshold) * 100.0)
+        if getattr(self.model, 'monotonic', False):
+            k = int(np.searchsorted(fade, threshold_fade))
         else:
-            eol_time = np.inf
-            eol_cycles = np.inf
+            k = first_crossing(fade, threshold_fade)
+        if k < 0 or k >= fade.size:
+            return np.inf, np.inf
         
-        return eol_time, eol_cycles
+        # The grid is integer days, so the index is the EOL day
+        eol_time = float(k)
+        return eol_time, float(cycles[k])
+    
+    def _retention_curve(self, temperature: float, cycles_per_day: float,
+                         max_years: int,
+                         **kwargs) -> Tuple[np.ndarray, np.ndarray]:
+        """Sample capacity retention [0-1] at display resolution."""
+        time_days = np.linspace(0, max_years * 365, 500)
+        cycles = time_days * cycles_per_day
+        
+        fade = self.model.predict_fade(time_days, cycles, temperature, **kwargs)
+        
+        # Convert fade [%] to retention [0-1] in a single owned buffer; the
+        # model's array may be cached or read-only, so it is not modified
+        retention = np.multiply(fade, -0.01, dtype=np.float64)
+        retention += 1.0
+        
+        return time_days, retention
     
     def plot_lifetime_prediction(self, temperature: float,
                                 cycles_per_day: float = 1.0,
                                 eol_threshold: float = 0.8,
+                                precomputed: Optional[tuple] = None,
                                 **kwargs):
         """
         Plot capacity retention over lifetime.
+        
+        Passing the curve from ``estimate_lifetime(..., return_curve=True)``
+        as ``precomputed=(time_days, retention, eol_time)`` avoids
+        re-evaluating the model; the EOL marker uses that ``eol_time``.
         """
-        max_years = 25
-        time_days = np.linspace(0, max_years * 365, 500)
-        cycles = time_days * cycles_per_day
+        import matplotlib.pyplot as plt
         
-        fade = self.model.predict_fade(time_days, cycles, temperature, **kwargs)
-        retention = 1.0 - (fade / 100.0)
+        max_years = 25
+        if precomputed is None:
+            time_days, retention = self._retention_curve(
+                temperature, cycles_per_day, max_years, **kwargs
+            )
+            eol_time, _ = self.estimate_lifetime(temperature, cycles_per_day,
+                                                 eol_threshold, max_years,
+                                                 **kwargs)
+        else:
+            time_days, retention, eol_time = precomputed
         
         time_years = time_days / 365.0
         
@@ -92,6 +214,10 @@ class LifetimePredictor:
         plt.axhline(y=eol_threshold * 100, color='r', linestyle='--', 
                    linewidth=2, label=f'EOL ({eol_threshold*100}%)')
         
+        if eol_time <= time_days[-1]:
+            plt.plot(eol_time / 365.0, eol_threshold * 100, 'ko',
+                    markersize=8, label=f'EOL at {eol_time/365.0:.1f} years')
+        
         plt.xlabel('Time (years)', fontsize=12, fontweight='bold')
         plt.ylabel('Capacity Retention (%)', fontsize=12, fontweight='bold')
         plt.title('Battery Lifetime Prediction', fontsize=14, fontweight='bold')
@@ -116,34 +242,51 @@ class LifetimePredictor:
             Cycles per day
         eol_threshold : float
             EOL threshold
+            
+        Returns:
+        --------
+        results : dict
+            Dictionary of {name: ScenarioResult}
         """
-        results = {}
+        max_years = 30
+        grid = None
         
-        for name, params in scenarios.items():
-            temp = params['temperature']
-            kwargs = {k: v for k, v in params.items() if k != 'temperature'}
+        def get_grid():
+            # Built on first use; root-found scenarios never need it
+            nonlocal grid
+            if grid is None:
+                grid = self._time_grid(cycles_per_day, max_years)
+            return grid
+        
+        def evaluate(params):
+            kwargs = dict(params)
+            temp = kwargs.pop('temperature')
             
-            eol_time, eol_cycles = self.estimate_lifetime(
-                temp, cycles_per_day, eol_threshold, **kwargs
+            eol_time, eol_cycles = self._estimate_lifetime(
+                temp, cycles_per_day, eol_threshold, max_years, get_grid,
+                **kwargs
             )
             
-            results[name] = {
-                'eol_years': eol_time / 365.0,
-                'eol_cycles': eol_cycles,
-                'temperature': temp
-            }
+            return ScenarioResult(eol_time / 365.0, eol_cycles, temp)
+        
+        # Scenarios are evaluated serially: they share self.model, and
+        # degradation models make no thread-safety guarantee
+        results = {name: evaluate(params) for name, params in scenarios.items()}
         
         # Print results
-        print("Lifetime Comparison")
-        print("=" * 70)
-        print(f"{'Scenario':<25} {'Temperature':<15} {'EOL Years':<15} {'EOL Cycles'}")
-        print("-" * 70)
+        lines = [
+            "Lifetime Comparison",
+            "=" * 70,
+            f"{'Scenario':<25} {'Temperature':<15} {'EOL Years':<15} {'EOL Cycles'}",
+            "-" * 70,
+        ]
         
         for name, res in results.items():
-            eol_str = f"{res['eol_years']:.1f}" if np.isfinite(res['eol_years']) else ">30"
-            cyc_str = f"{res['eol_cycles']:.0f}" if np.isfinite(res['eol_cycles']) else ">10000"
-            print(f"{name:<25} {res['temperature']:<15.1f} {eol_str:<15} {cyc_str}")
+            eol_str = f"{res.eol_years:.1f}" if np.isfinite(res.eol_years) else ">30"
+            cyc_str = f"{res.eol_cycles:.0f}" if np.isfinite(res.eol_cycles) else ">10000"
+            lines.append(f"{name:<25} {res.temperature:<15.1f} {eol_str:<15} {cyc_str}")
         
-        print("=" * 70)
+        lines.append("=" * 70)
+        sys.stdout.write("\n".join(lines) + "\n")
         
         return results
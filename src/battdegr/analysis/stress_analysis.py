@@ -3,7 +3,8 @@ Stress factor analysis tools
 """
 
 import numpy as np
-import matplotlib.pyplot as plt
+
+from ..utils.kernels import rmse, mape
 
 
 class StressFactorAnalysis:
@@ -22,9 +23,71 @@ class StressFactorAnalysis:
         """
         self.model = model
     
+    def _fade_broadcast(self, time_days, cycles, axis_name: str,
+                        axis_values, temperature, **kwargs):
+        """
+        Evaluate the model fade for a whole sweep in a single model call.
+        
+        Only the swept parameter and the time/cycle endpoints are broadcast
+        to the sweep shape; ``temperature`` and the other parameters are
+        passed through unchanged, so scalar inputs stay scalar.
+        """
+        time_days, cycles, axis_values = np.broadcast_arrays(
+            time_days, cycles, np.asarray(axis_values)
+        )
+        if axis_name == 'temperature':
+            temperature = axis_values
+        else:
+            kwargs[axis_name] = axis_values
+        
+        return np.asarray(self.model.predict_fade(time_days, cycles,
+                                                  temperature, **kwargs))
+    
+    def _run_sweep(self, axis_name: str, axis_values: np.ndarray,
+                   base_kwargs: dict, time_years: float,
+                   cycles_per_day: float) -> np.ndarray:
+        """
+        Evaluate fade at ``time_years`` for every value of one stress
+        factor in a single vectorized model call.
+        """
+        # Sweep endpoint as plain floats; _fade_broadcast expands them to
+        # the sweep shape at the model boundary
+        t_end = float(time_years * 365)
+        c_end = float(t_end * cycles_per_day)
+        
+        kwargs = dict(base_kwargs)
+        temperature = kwargs.pop('temperature', 25.0)
+        
+        return self._fade_broadcast(t_end, c_end, axis_name, axis_values,
+                                    temperature, **kwargs)
+    
+    def _plot_sweep(self, axis_values, fades, xlabel: str, marker: str,
+                    title: str, time_years: float, ax=None):
+        """
+        Plot capacity fade against one swept stress factor, into ``ax`` if
+        given, otherwise into a new figure that is shown immediately.
+        """
+        created = ax is None
+        if created:
+            import matplotlib.pyplot as plt
+            
+            fig, ax = plt.subplots(figsize=(10, 6))
+        
+        ax.plot(axis_values, fades, marker, linewidth=2, markersize=8)
+        ax.set_xlabel(xlabel, fontsize=12, fontweight='bold')
+        ax.set_ylabel(f'Capacity Fade after {time_years} years (%)', 
+                     fontsize=12, fontweight='bold')
+        ax.set_title(title, fontsize=14, fontweight='bold')
+        ax.grid(True, alpha=0.3)
+        
+        if created:
+            fig.tight_layout()
+            plt.show()
+    
     def temperature_sweep(self, temp_range: np.ndarray,
                          time_years: float = 10,
                          cycles_per_day: float = 1.0,
+                         ax=None,
                          **kwargs):
         """
         Analyze temperature impact on degradation.
@@ -37,90 +100,58 @@ class StressFactorAnalysis:
             Analysis time period [years]
         cycles_per_day : float
             Cycles per day
+        ax : matplotlib Axes, optional
+            Axes to draw into; a new figure is created and shown if omitted
         **kwargs : dict
             Additional parameters
         """
-        time_days = np.array([time_years * 365])
-        cycles = np.array([time_years * 365 * cycles_per_day])
-        
-        fades = []
-        for temp in temp_range:
-            fade = self.model.predict_fade(time_days, cycles, temp, **kwargs)[0]
-            fades.append(fade)
-        
-        # Plot results
-        plt.figure(figsize=(10, 6))
-        plt.plot(temp_range, fades, 'o-', linewidth=2, markersize=8)
-        plt.xlabel('Temperature (°C)', fontsize=12, fontweight='bold')
-        plt.ylabel(f'Capacity Fade after {time_years} years (%)', 
-                  fontsize=12, fontweight='bold')
-        plt.title('Temperature Impact on Battery Degradation', 
-                 fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.show()
+        fades = self._run_sweep('temperature', temp_range, kwargs,
+                                time_years, cycles_per_day)
+        self._plot_sweep(temp_range, fades, 'Temperature (°C)', 'o-',
+                         'Temperature Impact on Battery Degradation',
+                         time_years, ax)
         
-        return temp_range, np.array(fades)
+        return temp_range, fades
     
     def dod_sweep(self, dod_values: np.ndarray,
                   temperature: float = 25,
                   time_years: float = 10,
                   cycles_per_day: float = 1.0,
+                  ax=None,
                   **kwargs):
         """
         Analyze DoD impact on degradation.
-        """
-        time_days = np.array([time_years * 365])
-        cycles = np.array([time_years * 365 * cycles_per_day])
-        
-        fades = []
-        for dod in dod_values:
-            fade = self.model.predict_fade(time_days, cycles, temperature,
-                                          dod=dod, **kwargs)[0]
-            fades.append(fade)
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(dod_values * 100, fades, 's-', linewidth=2, markersize=8)
-        plt.xlabel('Depth of Discharge (%)', fontsize=12, fontweight='bold')
-        plt.ylabel(f'Capacity Fade after {time_years} years (%)', 
-                  fontsize=12, fontweight='bold')
-        plt.title('DoD Impact on Battery Degradation', 
-                 fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.show()
+        See `temperature_sweep` for the ``ax`` argument.
+        """
+        fades = self._run_sweep('dod', dod_values,
+                                {'temperature': temperature, **kwargs},
+                                time_years, cycles_per_day)
+        self._plot_sweep(dod_values * 100, fades, 'Depth of Discharge (%)',
+                         's-', 'DoD Impact on Battery Degradation',
+                         time_years, ax)
         
-        return dod_values, np.array(fades)
+        return dod_values, fades
     
     def crate_sweep(self, c_rates: np.ndarray,
                    temperature: float = 25,
                    time_years: float = 10,
                    cycles_per_day: float = 1.0,
+                   ax=None,
                    **kwargs):
         """
         Analyze C-rate impact on degradation.
-        """
-        time_days = np.array([time_years * 365])
-        cycles = np.array([time_years * 365 * cycles_per_day])
-        
-        fades = []
-        for c_rate in c_rates:
-            fade = self.model.predict_fade(time_days, cycles, temperature,
-                                          c_rate=c_rate, **kwargs)[0]
-            fades.append(fade)
         
-        plt.figure(figsize=(10, 6))
-        plt.plot(c_rates, fades, '^-', linewidth=2, markersize=8)
-        plt.xlabel('C-rate', fontsize=12, fontweight='bold')
-        plt.ylabel(f'Capacity Fade after {time_years} years (%)', 
-                  fontsize=12, fontweight='bold')
-        plt.title('C-rate Impact on Battery Degradation', 
-                 fontsize=14, fontweight='bold')
-        plt.grid(True, alpha=0.3)
-        plt.tight_layout()
-        plt.show()
+        See `temperature_sweep` for the ``ax`` argument.
+        """
+        fades = self._run_sweep('c_rate', c_rates,
+                                {'temperature': temperature, **kwargs},
+                                time_years, cycles_per_day)
+        self._plot_sweep(c_rates, fades, 'C-rate', '^-',
+                         'C-rate Impact on Battery Degradation',
+                         time_years, ax)
         
-        return c_rates, np.array(fades)
+        return c_rates, fades
 
 
 class ModelValidator:
@@ -134,9 +165,9 @@ class ModelValidator:
     def calculate_rmse(self, predicted: np.ndarray, 
                       actual: np.ndarray) -> float:
         """Calculate root mean square error."""
-        return np.sqrt(np.mean((predicted - actual) ** 2))
+        return rmse(predicted, actual)
     
     def calculate_mape(self, predicted: np.ndarray,
                       actual: np.ndarray) -> float:
         """Calculate mean absolute percentage error."""
-        return np.mean(np.abs((predicted - actual) / actual)) * 100
+        return mape(predicted, actual)
@@ -0,0 +1,41 @@
+"""
+Numba-compiled kernels backing `battdegr.utils.kernels`
+
+Imported lazily on the first compiled call so that importing battdegr
+does not load numba.
+"""
+
+import numpy as np
+from numba import njit, prange
+
+
+@njit(fastmath=True, parallel=True, cache=True)
+def rmse_kernel(p, a):
+    s = 0.0
+    for i in prange(p.shape[0]):
+        d = p[i] - a[i]
+        s += d * d
+    return np.sqrt(s / p.shape[0])
+
+
+# No nnan/ninf flags: with them the zero test lets NaN actuals drop out
+# of the mean instead of propagating
+@njit(fastmath={'reassoc', 'contract', 'arcp'}, parallel=True, cache=True)
+def mape_kernel(p, a):
+    s = 0.0
+    n = 0
+    for i in prange(p.shape[0]):
+        if a[i] != 0:
+            s += abs((p[i] - a[i]) * (1.0 / a[i]))
+            n += 1
+    if n == 0:
+        return np.nan
+    return s / n * 100.0
+
+
+@njit(cache=True)
+def first_crossing_kernel(values, threshold):
+    for i in range(values.size):
+        if values[i] >= threshold:
+            return i
+    return -1
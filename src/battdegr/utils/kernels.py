@@ -0,0 +1,102 @@
+"""
+Compiled numerical kernels with NumPy fallbacks
+
+Numba is optional; when it is not installed the public helpers fall back
+to equivalent NumPy expressions.
+"""
+
+from importlib.util import find_spec
+
+import numpy as np
+
+# Checked without importing; numba itself is loaded on the first compiled call
+HAS_NUMBA = find_spec("numba") is not None
+
+
+def first_crossing(values, threshold, compiled: bool = False) -> int:
+    """
+    Index of the first element reaching ``threshold``, or -1 if none does.
+
+    Unlike a sorted search this makes no monotonicity assumption. The
+    NumPy ``argmax`` scan is the default: on day-resolution lifetime grids
+    it is as fast as the compiled loop and needs no JIT warm-up. The
+    compiled scan stops at the crossing without allocating, which only
+    pays off for long arrays that cross early.
+
+    Parameters:
+    -----------
+    values : array
+        1-D samples to scan
+    threshold : float
+        Value to reach (``values[i] >= threshold``)
+    compiled : bool
+        Use the Numba early-exit scan when numba is installed
+    """
+    values = np.ascontiguousarray(values)
+    if values.size == 0:
+        return -1
+    if compiled and HAS_NUMBA:
+        # Compare as float so integer input does not truncate the threshold
+        from ._numba_kernels import first_crossing_kernel
+
+        return int(first_crossing_kernel(values, float(threshold)))
+    hit = values >= threshold
+    k = int(np.argmax(hit))
+    return k if hit[k] else -1
+
+
+def _as_flat_pair(predicted, actual):
+    """Broadcast two inputs and return them as contiguous float64 vectors."""
+    p, a = np.broadcast_arrays(np.asarray(predicted, dtype=np.float64),
+                               np.asarray(actual, dtype=np.float64))
+    return np.ascontiguousarray(p.ravel()), np.ascontiguousarray(a.ravel())
+
+
+def rmse(predicted, actual) -> float:
+    """
+    Root mean square error in a single fused pass.
+
+    Parameters:
+    -----------
+    predicted : array
+        Predicted values
+    actual : array
+        Measured values
+    """
+    p, a = _as_flat_pair(predicted, actual)
+    if p.size == 0:
+        return np.nan
+    if HAS_NUMBA:
+        from ._numba_kernels import rmse_kernel
+
+        return float(rmse_kernel(p, a))
+    return float(np.sqrt(np.mean((p - a) ** 2)))
+
+
+def mape(predicted, actual) -> float:
+    """
+    Mean absolute percentage error [%] in a single fused pass.
+
+    Points where ``actual`` is zero have no defined percentage error and
+    are excluded from the mean; NaN is returned if every point is zero.
+    NaN in either input propagates to the result. Both paths multiply by
+    the reciprocal of ``actual`` rather than dividing inside the reduction.
+
+    Parameters:
+    -----------
+    predicted : array
+        Predicted values
+    actual : array
+        Measured values
+    """
+    p, a = _as_flat_pair(predicted, actual)
+    if HAS_NUMBA:
+        from ._numba_kernels import mape_kernel
+
+        return float(mape_kernel(p, a))
+
+    nonzero = a != 0
+    if not nonzero.any():
+        return np.nan
+    p, a = p[nonzero], a[nonzero]
+    return float(np.mean(np.abs((p - a) * np.reciprocal(a))) * 100)
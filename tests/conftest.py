@@ -0,0 +1,22 @@
+"""
+Shared pytest configuration
+
+``battdegr/__init__.py`` re-exports the degradation models from
+``battdegr.models``. Where that package is not available, register an
+empty stand-in so the analysis and utility modules can still be imported
+and tested on their own.
+"""
+
+import sys
+import types
+
+try:
+    import battdegr  # noqa: F401
+except ModuleNotFoundError as exc:
+    if exc.name != "battdegr.models":
+        raise
+
+    models = types.ModuleType("battdegr.models")
+    for name in ("MechanisticModel", "SemiEmpiricalModel", "EmpiricalModel"):
+        setattr(models, name, type(name, (), {}))
+    sys.modules["battdegr.models"] = models
@@ -0,0 +1,87 @@
+"""
+Tests for the compiled kernels and their NumPy fallbacks
+"""
+
+import numpy as np
+import pytest
+
+from battdegr.utils import kernels
+
+
+@pytest.fixture(params=[True, False], ids=["numba", "numpy"])
+def backend(request, monkeypatch):
+    """Run each test with the Numba kernels (if installed) and without."""
+    if request.param and not kernels.HAS_NUMBA:
+        pytest.skip("numba not installed")
+    monkeypatch.setattr(kernels, "HAS_NUMBA", request.param)
+    return kernels
+
+
+@pytest.fixture
+def data():
+    rng = np.random.default_rng(0)
+    return rng.random(1000) + 1.0, rng.random(1000) + 1.0
+
+
+def test_rmse_matches_numpy(backend, data):
+    predicted, actual = data
+    expected = np.sqrt(np.mean((predicted - actual) ** 2))
+
+    assert backend.rmse(predicted, actual) == pytest.approx(expected)
+
+
+def test_rmse_broadcasts_scalar(backend):
+    assert backend.rmse([1.0, 2.0], 3.0) == pytest.approx(np.sqrt(2.5))
+
+
+def test_rmse_empty(backend):
+    assert np.isnan(backend.rmse([], []))
+
+
+def test_mape_matches_numpy(backend, data):
+    predicted, actual = data
+    expected = np.mean(np.abs((predicted - actual) / actual)) * 100
+
+    assert backend.mape(predicted, actual) == pytest.approx(expected)
+
+
+def test_mape_skips_zero_actuals(backend):
+    assert backend.mape([1.0, 2.0, 3.0], [0.0, 2.0, 2.0]) == pytest.approx(25.0)
+
+
+def test_mape_all_zero_actuals(backend):
+    assert np.isnan(backend.mape([1.0, 2.0], [0.0, 0.0]))
+
+
+def test_mape_propagates_nan(backend):
+    assert np.isnan(backend.mape([2.0, 1.0], [np.nan, 1.0]))
+    assert np.isnan(backend.mape([np.nan, 1.0], [2.0, 1.0]))
+
+
+def test_mape_empty(backend):
+    assert np.isnan(backend.mape([], []))
+
+
+def test_first_crossing_non_monotonic(backend):
+    values = np.array([1.0, 3.0, 2.0, 5.0])
+
+    assert backend.first_crossing(values, 2.5, compiled=True) == 1
+    assert backend.first_crossing(values, 4.0, compiled=True) == 3
+
+
+def test_first_crossing_integer_input(backend):
+    assert backend.first_crossing(np.array([1, 2, 3]), 2.5, compiled=True) == 2
+
+
+def test_first_crossing_float32_input(backend):
+    values = np.arange(100, dtype=np.float32)
+
+    assert backend.first_crossing(values, np.float32(41.5), compiled=True) == 42
+
+
+def test_first_crossing_no_crossing(backend):
+    assert backend.first_crossing(np.array([1.0, 2.0]), 5.0, compiled=True) == -1
+
+
+def test_first_crossing_empty(backend):
+    assert backend.first_crossing(np.array([]), 1.0, compiled=True) == -1
@@ -0,0 +1,81 @@
+"""
+Tests for lifetime prediction and end-of-life assessment
+"""
+
+import numpy as np
+import pytest
+
+from battdegr.analysis import LifetimePredictor
+
+
+class SqrtFadeModel:
+    """Monotonic calendar + cycling fade [%]."""
+
+    monotonic = True
+
+    def predict_fade(self, time_days, cycles, temperature, **kwargs):
+        time_days = np.asarray(time_days, dtype=np.float64)
+        cycles = np.asarray(cycles, dtype=np.float64)
+        return 0.05 * np.sqrt(time_days) + 0.002 * cycles
+
+
+class WavyFadeModel:
+    """Non-monotonic fade [%] that first reaches 20% on day 313."""
+
+    def predict_fade(self, time_days, cycles, temperature, **kwargs):
+        time_days = np.asarray(time_days, dtype=np.float64)
+        return 15 + 8 * np.sin(time_days / 500) + 0.001 * time_days
+
+
+def test_monotonic_model_matches_dense_scan():
+    predictor = LifetimePredictor(SqrtFadeModel())
+
+    eol_time, eol_cycles = predictor.estimate_lifetime(25)
+    scan_time, _ = predictor._estimate_lifetime_core(
+        *predictor._time_grid(1.0, 30), 25, 0.8
+    )
+
+    assert eol_time == pytest.approx(scan_time, abs=1.0)
+    assert eol_cycles == pytest.approx(eol_time)
+
+
+def test_non_monotonic_model_returns_first_crossing():
+    predictor = LifetimePredictor(WavyFadeModel())
+
+    eol_time, eol_cycles = predictor.estimate_lifetime(25)
+
+    assert eol_time == 313.0
+    assert eol_cycles == 313.0
+
+
+def test_eol_not_reached():
+    predictor = LifetimePredictor(SqrtFadeModel())
+
+    assert predictor.estimate_lifetime(25, max_years=1) == (np.inf, np.inf)
+
+
+class CachedFadeModel:
+    """Returns the same (optionally read-only) array on every call."""
+
+    def __init__(self, read_only):
+        self.read_only = read_only
+        self.cache = None
+
+    def predict_fade(self, time_days, cycles, temperature, **kwargs):
+        if self.cache is None:
+            self.cache = np.full(np.shape(time_days), 2.0)
+            self.cache.flags.writeable = not self.read_only
+        return self.cache
+
+
+@pytest.mark.parametrize("read_only", [False, True])
+def test_retention_curve_leaves_model_output_unchanged(read_only):
+    model = CachedFadeModel(read_only)
+    predictor = LifetimePredictor(model)
+
+    _, first = predictor._retention_curve(25, 1.0, 25)
+    _, second = predictor._retention_curve(25, 1.0, 25)
+
+    np.testing.assert_array_equal(model.cache, 2.0)
+    np.testing.assert_allclose(first, 0.98)
+    np.testing.assert_allclose(second, 0.98)
@@ -0,0 +1,78 @@
+"""
+Tests for stress factor sweeps
+"""
+
+import numpy as np
+import pytest
+
+from battdegr.analysis import StressFactorAnalysis
+
+
+class ThresholdModel:
+    """Calendar + cycling fade [%] that vectorizes over every input."""
+
+    def predict_fade(self, time_days, cycles, temperature, dod=0.8,
+                     c_rate=1.0, soc_avg=0.5):
+        accel = np.exp((np.asarray(temperature) - 25) / 20)
+        fade = (0.05 * np.sqrt(time_days) * accel * (0.5 + soc_avg)
+                + 0.002 * cycles * np.asarray(dod) * np.asarray(c_rate))
+        return fade
+
+
+class HotCutoffModel(ThresholdModel):
+    """Branches on ``temperature``, so it must receive a scalar."""
+
+    def predict_fade(self, time_days, cycles, temperature, **kwargs):
+        fade = super().predict_fade(time_days, cycles, temperature, **kwargs)
+        if temperature > 45:
+            fade = fade * 2
+        return fade
+
+
+class StubAxes:
+    """Records nothing; stands in for a matplotlib Axes."""
+
+    def __getattr__(self, name):
+        return lambda *args, **kwargs: None
+
+
+def reference_fades(model, axis_name, axis_values, temperature=25,
+                    time_years=10, cycles_per_day=1.0, **kwargs):
+    """Evaluate one sweep value per model call with length-1 arrays."""
+    time_days = np.array([time_years * 365])
+    cycles = np.array([time_years * 365 * cycles_per_day])
+
+    fades = []
+    for value in axis_values:
+        params = {'temperature': temperature, **kwargs, axis_name: value}
+        temp = params.pop('temperature')
+        fades.append(model.predict_fade(time_days, cycles, temp, **params)[0])
+    return np.array(fades)
+
+
+def test_temperature_sweep_matches_per_value_calls():
+    model = ThresholdModel()
+    temps = np.array([10.0, 25.0, 40.0])
+
+    _, fades = StressFactorAnalysis(model).temperature_sweep(
+        temps, soc_avg=0.7, ax=StubAxes()
+    )
+
+    expected = reference_fades(model, 'temperature', temps, soc_avg=0.7)
+    np.testing.assert_allclose(fades, expected)
+
+
+@pytest.mark.parametrize("method, axis_name, values", [
+    ("dod_sweep", "dod", np.array([0.2, 0.5, 0.8])),
+    ("crate_sweep", "c_rate", np.array([0.5, 1.0, 2.0])),
+])
+def test_parameter_sweeps_keep_temperature_scalar(method, axis_name, values):
+    model = HotCutoffModel()
+    analysis = StressFactorAnalysis(model)
+
+    _, fades = getattr(analysis, method)(values, temperature=50,
+                                         soc_avg=0.7, ax=StubAxes())
+
+    expected = reference_fades(model, axis_name, values, temperature=50,
+                               soc_avg=0.7)
+    np.testing.assert_allclose(fades, expected)